@@ -11,7 +11,7 @@ Created on Sep 28, 2016
 """
 from atom.api import (
     Atom, Instance, ForwardInstance, Typed, ForwardTyped, List, Enum,
-    Float, Bool, Coerced, observe
+    Float, Bool, Coerced
 )
 from enaml.core.declarative import d_
 
@@ -36,6 +36,12 @@ class ProxyBooleanOperation(ProxyOperation):
     def set_unify(self, unify):
         raise NotImplementedError
 
+    def set_glue(self, glue):
+        raise NotImplementedError
+
+    def set_fuzzy_value(self, value):
+        raise NotImplementedError
+
     def _do_operation(self, shape1, shape2):
         raise NotImplementedError
 
@@ -254,19 +260,28 @@ class BooleanOperation(Operation):
         The first shape argument of the operation.
     shape2: Shape
         The second shape argument of the operation.
+    glue: String
+        Use the faster gluing algorithm for shapes which only touch or
+        overlap along shared faces. Use 'shift' when the shapes only share
+        faces and 'full' when they also coincide.
+    fuzzy_value: Float
+        Additional tolerance used when finding intersections. Zero disables
+        the fuzzy mode.
 
     """
 
-    shape1 = d_(Instance(object))
+    shape1 = d_(Instance(object)).tag(proxy=True)
 
-    shape2 = d_(Instance(object))
+    shape2 = d_(Instance(object)).tag(proxy=True)
 
     #: Unify using ShapeUpgrade_UnifySameDomain
-    unify = d_(Bool(False))
+    unify = d_(Bool(False)).tag(proxy=True)
 
-    @observe('shape1', 'shape2', 'unify')
-    def _update_proxy(self, change):
-        super(BooleanOperation, self)._update_proxy(change)
+    #: Gluing mode
+    glue = d_(Enum('off', 'shift', 'full')).tag(proxy=True)
+
+    #: Fuzzy tolerance
+    fuzzy_value = d_(Float(0, strict=False)).tag(proxy=True)
 
 
 class Common(BooleanOperation):
@@ -398,22 +413,19 @@ class Fillet(Operation):
     proxy = Typed(ProxyFillet)
 
     #: If True, don't apply the fillet (for debugging)
-    disabled = d_(Bool())
+    disabled = d_(Bool()).tag(proxy=True)
 
     #: Fillet shape type
     shape_type = d_(Enum('rational', 'angular', 'polynomial')).tag(
-        view=True, group='Fillet')
+        view=True, group='Fillet', proxy=True)
 
     #: Radius of fillet
-    radius = d_(Float(1, strict=False)).tag(view=True, group='Fillet')
+    radius = d_(Float(1, strict=False)).tag(
+        view=True, group='Fillet', proxy=True)
 
     #: Edges to apply fillet to and parameters
     #: Leave blank to use all edges of the shape
-    operations = d_(List()).tag(view=True, group='Fillet')
-
-    @observe('shape_type', 'radius', 'operations', 'disabled')
-    def _update_proxy(self, change):
-        super(Fillet, self)._update_proxy(change)
+    operations = d_(List()).tag(view=True, group='Fillet', proxy=True)
 
 
 class Chamfer(Operation):
@@ -445,20 +457,18 @@ class Chamfer(Operation):
     proxy = Typed(ProxyChamfer)
 
     #: If True, don't apply the chamfer (for debugging)
-    disabled = d_(Bool())
+    disabled = d_(Bool()).tag(proxy=True)
 
     #: Distance of chamfer
-    distance = d_(Float(1, strict=False)).tag(view=True, group='Chamfer')
+    distance = d_(Float(1, strict=False)).tag(
+        view=True, group='Chamfer', proxy=True)
 
     #: Second of chamfer (leave 0 if not used)
-    distance2 = d_(Float(0, strict=False)).tag(view=True, group='Chamfer')
+    distance2 = d_(Float(0, strict=False)).tag(
+        view=True, group='Chamfer', proxy=True)
 
     #: Edges or faces to apply chamfer to
-    operations = d_(List()).tag(view=True, group='Chamfer')
-
-    @observe('distance', 'distance2', 'operations', 'disabled')
-    def _update_proxy(self, change):
-        super(Chamfer, self)._update_proxy(change)
+    operations = d_(List()).tag(view=True, group='Chamfer', proxy=True)
 
 
 class Offset(Operation):
@@ -491,29 +501,25 @@ class Offset(Operation):
     proxy = Typed(ProxyOffset)
 
     #: Whether the offset should be closed
-    closed = d_(Bool(True))
+    closed = d_(Bool(True)).tag(proxy=True)
 
     #: Offset
-    offset = d_(Float(1, strict=False)).tag(view=True, group='Offset')
+    offset = d_(Float(1, strict=False)).tag(
+        view=True, group='Offset', proxy=True)
 
     #: Offset mode
     offset_mode = d_(Enum('skin', 'pipe', 'recto_verso')).tag(
-        view=True, group='Offset')
+        view=True, group='Offset', proxy=True)
 
     #: Intersection
-    intersection = d_(Bool(False)).tag(view=True, group='Offset')
+    intersection = d_(Bool(False)).tag(view=True, group='Offset', proxy=True)
 
     #: Join type
     join_type = d_(Enum('arc', 'tangent', 'intersection')).tag(
-        view=True, group='Offset')
+        view=True, group='Offset', proxy=True)
 
     #: The shape to offset if given
-    shape = d_(Instance((Shape, TopoDS_Shape)))
-
-    @observe('offset', 'offset_mode', 'intersection', 'join_type', 'closed',
-             'shape')
-    def _update_proxy(self, change):
-        super(Offset, self)._update_proxy(change)
+    shape = d_(Instance((Shape, TopoDS_Shape))).tag(proxy=True)
 
 
 class OffsetShape(Offset):
@@ -570,11 +576,7 @@ class ThickSolid(Offset):
     proxy = Typed(ProxyThickSolid)
 
     #: Closing faces
-    faces = d_(List()).tag(view=True, group='ThickSolid')
-
-    @observe('faces')
-    def _update_proxy(self, change):
-        super(ThickSolid, self)._update_proxy(change)
+    faces = d_(List()).tag(view=True, group='ThickSolid', proxy=True)
 
 
 class Pipe(Operation):
@@ -601,20 +603,17 @@ class Pipe(Operation):
     proxy = Typed(ProxyPipe)
 
     #: Spline to make the pipe along
-    spline = d_(Instance(object))
+    spline = d_(Instance(object)).tag(proxy=True)
 
     #: Profile to make the pipe from
-    profile = d_(Instance(object))
+    profile = d_(Instance(object)).tag(proxy=True)
 
     #: Fill mode
     fill_mode = d_(Enum(None, 'corrected_frenet', 'fixed', 'frenet',
                         'constant_normal', 'darboux', 'guide_ac', 'guide_plan',
                         'guide_ac_contact', 'guide_plan_contact',
-                        'discrete_trihedron')).tag(view=True, group='Pipe')
-
-    @observe('spline', 'profile', 'fill_mode')
-    def _update_proxy(self, change):
-        super(Pipe, self)._update_proxy(change)
+                        'discrete_trihedron')).tag(
+        view=True, group='Pipe', proxy=True)
 
 
 class AbstractRibSlot(Operation):
@@ -682,23 +681,22 @@ class ThruSections(Operation):
     #: isSolid is set to true if the construction algorithm is required
     #: to build a solid or to false if it is required to build a shell
     #: (the default value),
-    solid = d_(Bool(False)).tag(view=True, group='Through Sections')
+    solid = d_(Bool(False)).tag(
+        view=True, group='Through Sections', proxy=True)
 
     #: ruled is set to true if the faces generated between the edges
     #: of two consecutive wires are ruled surfaces or to false
     #: (the default value)
     #: if they are smoothed out by approximation
-    ruled = d_(Bool(False)).tag(view=True, group='Through Sections')
+    ruled = d_(Bool(False)).tag(
+        view=True, group='Through Sections', proxy=True)
 
     #: pres3d defines the precision criterion used by the approximation
     #:  algorithm;
     #: the default value is 1.0e-6. Use AddWire and AddVertex to define
     #: the successive sections of the shell or solid to be built.
-    precision = d_(Float(1e-6)).tag(view=True, group='Through Sections')
-
-    @observe('solid', 'ruled', 'precision')
-    def _update_proxy(self, change):
-        super(ThruSections, self)._update_proxy(change)
+    precision = d_(Float(1e-6)).tag(
+        view=True, group='Through Sections', proxy=True)
 
 
 class TransformOperation(Atom):
@@ -804,11 +802,7 @@ class Transform(Operation):
     shape = d_(Instance(object))
 
     #: Transform ops
-    operations = d_(List(TransformOperation))
-
-    @observe('operations')
-    def _update_proxy(self, change):
-        super(Transform, self)._update_proxy(change)
+    operations = d_(List(TransformOperation)).tag(proxy=True)
 
 
 class Sew(Operation):
@@ -272,7 +272,7 @@ class Edge(Shape):
         value: Tuple or Float
 
         """
-        return self.proxy.get_value_at(t, derivative)
+        return self.get_proxy().get_value_at(t, derivative)
 
 
 class Line(Edge):
@@ -297,19 +297,15 @@ class Line(Edge):
     proxy = Typed(ProxyLine)
 
     #: List of points
-    points = d_(List(Coerced(Pt, coercer=coerce_point)))
+    points = d_(List(Coerced(Pt, coercer=coerce_point))).tag(proxy=True)
 
     @property
     def start(self):
-        return coerce_point(self.proxy.curve.StartPoint())
+        return coerce_point(self.get_proxy().curve.StartPoint())
 
     @property
     def end(self):
-        return coerce_point(self.proxy.curve.EndPoint())
-
-    @observe('points')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+        return coerce_point(self.get_proxy().curve.EndPoint())
 
 
 class Segment(Line):
@@ -407,11 +403,7 @@ class Circle(Edge):
     proxy = Typed(ProxyCircle)
 
     #: Radius of the circle
-    radius = d_(Float(1, strict=False)).tag(view=True)
-
-    @observe('radius')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+    radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
 
 class Ellipse(Edge):
@@ -436,14 +428,10 @@ class Ellipse(Edge):
     proxy = Typed(ProxyEllipse)
 
     #: Radius of the ellipse
-    major_radius = d_(Float(1, strict=False)).tag(view=True)
+    major_radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Minor radius of the ellipse
-    minor_radius = d_(Float(1, strict=False)).tag(view=True)
-
-    @observe('major_radius', 'minor_radius')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+    minor_radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
 
 class Hyperbola(Edge):
@@ -489,22 +477,18 @@ class Hyperbola(Edge):
     proxy = Typed(ProxyHyperbola)
 
     #: Major radius of the hyperbola
-    major_radius = d_(Float(1, strict=False)).tag(view=True)
+    major_radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Minor radius of the hyperbola
-    minor_radius = d_(Float(1, strict=False)).tag(view=True)
+    minor_radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     @property
     def start(self):
-        return coerce_point(self.proxy.curve.StartPoint())
+        return coerce_point(self.get_proxy().curve.StartPoint())
 
     @property
     def end(self):
-        return coerce_point(self.proxy.curve.EndPoint())
-
-    @observe('major_radius', 'minor_radius')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+        return coerce_point(self.get_proxy().curve.EndPoint())
 
 
 class Parabola(Edge):
@@ -536,19 +520,15 @@ class Parabola(Edge):
     proxy = Typed(ProxyParabola)
 
     #: Focal length of the parabola
-    focal_length = d_(Float(1, strict=False)).tag(view=True)
+    focal_length = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     @property
     def start(self):
-        return coerce_point(self.proxy.curve.StartPoint())
+        return coerce_point(self.get_proxy().curve.StartPoint())
 
     @property
     def end(self):
-        return coerce_point(self.proxy.curve.EndPoint())
-
-    @observe('focal_length')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+        return coerce_point(self.get_proxy().curve.EndPoint())
 
 
 class BSpline(Line):
@@ -627,14 +607,10 @@ class Wire(Edge):
     proxy = Typed(ProxyWire)
 
     #: Edges used to create this wire
-    edges = d_(List())
+    edges = d_(List()).tag(proxy=True)
 
     #: Reverse the order of the wire
-    reverse = d_(Bool())
-
-    @observe('edges', 'reverse')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+    reverse = d_(Bool()).tag(proxy=True)
 
     def points_of_discontinuity(self, tolerance=0.5):
         """ Find points of discontinuity
@@ -706,22 +682,18 @@ class Polyline(Wire):
     proxy = Typed(ProxyPolyline)
 
     #: Polyline is closed
-    closed = d_(Bool(False)).tag(view=True)
+    closed = d_(Bool(False)).tag(view=True, proxy=True)
 
     #: List of points
-    points = d_(List(Coerced(Pt, coercer=coerce_point)))
+    points = d_(List(Coerced(Pt, coercer=coerce_point))).tag(proxy=True)
 
     @property
     def start(self):
-        return coerce_point(self.proxy.curve.StartPoint())
+        return coerce_point(self.get_proxy().curve.StartPoint())
 
     @property
     def end(self):
-        return coerce_point(self.proxy.curve.EndPoint())
-
-    @observe('closed', 'points')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+        return coerce_point(self.get_proxy().curve.EndPoint())
 
 
 class Polygon(Polyline):
@@ -790,18 +762,14 @@ class Rectangle(Wire):
     proxy = Typed(ProxyRectangle)
 
     #: Width of the rectangle
-    width = d_(Float(1, strict=False)).tag(view=True)
+    width = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Height of the rectangle
-    height = d_(Float(1, strict=False)).tag(view=True)
+    height = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Radius of the corner
-    rx = d_(Float(0, strict=False)).tag(view=True)
-    ry = d_(Float(0, strict=False)).tag(view=True)
-
-    @observe('width', 'height', 'rx', 'ry')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+    rx = d_(Float(0, strict=False)).tag(view=True, proxy=True)
+    ry = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
 
 class Text(Shape):
@@ -835,28 +803,25 @@ class Text(Shape):
     proxy = Typed(ProxyText)
 
     #: Text to display
-    text = d_(Str())
+    text = d_(Str()).tag(proxy=True)
 
     #: Font to use
-    font = d_(Str())
+    font = d_(Str()).tag(proxy=True)
 
     #: Font size
-    size = d_(Float(12.0, strict=False))
+    size = d_(Float(12.0, strict=False)).tag(proxy=True)
 
     #: Font style
-    style = d_(Enum('regular', 'bold', 'italic', 'bold-italic'))
+    style = d_(Enum('regular', 'bold', 'italic',
+                    'bold-italic')).tag(proxy=True)
 
     #: Font alignment
-    horizontal_alignment = d_(Enum('left', 'center', 'right'))
-    vertical_alignment = d_(Enum('bottom', 'center', 'top', 'topfirstline'))
+    horizontal_alignment = d_(Enum('left', 'center', 'right')).tag(proxy=True)
+    vertical_alignment = d_(Enum('bottom', 'center', 'top',
+                                 'topfirstline')).tag(proxy=True)
 
     #: Composite curve
-    composite = d_(Bool(True))
-
-    @observe('text', 'font', 'size', 'style', 'composite',
-             'horizontal_alignment', 'vertical_alignment')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
+    composite = d_(Bool(True)).tag(proxy=True)
 
 
 class Svg(Wire):
@@ -880,12 +845,7 @@ class Svg(Wire):
     proxy = Typed(ProxySvg)
 
     #: Source file or text
-    source = d_(Str())
+    source = d_(Str()).tag(proxy=True)
 
     #: Mirror y
     mirror = d_(Bool(True))
-
-    @observe('source')
-    def _update_proxy(self, change):
-        super()._update_proxy(change)
-
@@ -258,6 +258,8 @@ class Direction(Point):
 
 
 def coerce_point(arg):
+    if isinstance(arg, (tuple, list)):  # Most common so check it first
+        return Point(*arg)
     if isinstance(arg, TopoDS_Shape):
         arg = BRep_Tool.Pnt_(arg)
     if hasattr(arg, 'XYZ'):  # copy from gp_Pnt, gp_Vec, gp_Dir, etc..
@@ -9,11 +9,15 @@ Created on Sep 27, 2016
 
 @author: jrm
 """
-from atom.api import Int, Dict, Instance, Subclass, set_default
-from enaml.application import timed_call
+from atom.api import (
+    Bool, Int, Instance, Subclass, Value, set_default
+)
+from enaml.application import Application, timed_call
 
 from OCCT.BOPAlgo import (
-    BOPAlgo_Splitter, BOPAlgo_Section, BOPAlgo_MakeConnected
+    BOPAlgo_Splitter, BOPAlgo_Section, BOPAlgo_MakeConnected,
+    BOPAlgo_CellsBuilder,
+    BOPAlgo_GlueOff, BOPAlgo_GlueShift, BOPAlgo_GlueFull
 )
 from OCCT.BRep import BRep_Builder
 from OCCT.BRepAlgoAPI import (
@@ -51,11 +55,13 @@ from OCCT.GeomFill import (
     GeomFill_IsDiscreteTrihedron
 )
 from OCCT.gp import (
-    gp_Trsf, gp_Vec, gp_Pnt, gp_Ax1, gp_Ax2, gp_Ax3, gp_Dir, gp_Pnt2d
+    gp_Trsf, gp_Vec, gp_Pnt, gp_Ax1, gp_Ax2, gp_Ax3, gp_Dir, gp_Pnt2d,
+    gp_Identity, gp_Translation
 )
 from OCCT.ShapeAnalysis import ShapeAnalysis_FreeBounds
 from OCCT.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
 from OCCT.TColgp import TColgp_Array1OfPnt2d
+from OCCT.TopLoc import TopLoc_Location
 from OCCT.TopTools import TopTools_ListOfShape, TopTools_HSequenceOfShape
 from OCCT.TopoDS import (
     TopoDS, TopoDS_Edge, TopoDS_Face, TopoDS_Wire, TopoDS_Shape,
@@ -76,16 +82,119 @@ from .occ_shape import (
 )
 
 
+FILLET_SHAPES = {
+    'rational': ChFi3d_Rational,
+    'angular': ChFi3d_QuasiAngular,
+    'polynomial': ChFi3d_Polynomial
+}
+
+OFFSET_MODES = {
+    'skin': BRepOffset_Skin,
+    'pipe': BRepOffset_Pipe,
+    'recto_verso': BRepOffset_RectoVerso
+}
+
+JOIN_TYPES = {
+    'arc': GeomAbs_Arc,
+    'tangent': GeomAbs_Tangent,
+    'intersection': GeomAbs_Intersection,
+}
+
+FILL_MODES = {
+    'corrected_frenet': GeomFill_IsCorrectedFrenet,
+    'fixed': GeomFill_IsFixed,
+    'frenet': GeomFill_IsFrenet,
+    'constant_normal': GeomFill_IsConstantNormal,
+    'darboux': GeomFill_IsDarboux,
+    'guide_ac': GeomFill_IsGuideAC,
+    'guide_plan': GeomFill_IsGuidePlan,
+    'guide_ac_contact': GeomFill_IsGuideACWithContact,
+    'guide_plan_contact': GeomFill_IsGuidePlanWithContact,
+    'discrete_trihedron': GeomFill_IsDiscreteTrihedron
+}
+
+GLUE_MODES = {
+    'off': BOPAlgo_GlueOff,
+    'shift': BOPAlgo_GlueShift,
+    'full': BOPAlgo_GlueFull,
+}
+
+
 class OccOperation(OccDependentShape, ProxyOperation):
     """ Operation is a dependent shape that uses queuing to only
     perform the operation once all changes have settled because
     in general these operations are expensive.
     """
-    def set_direction(self, direction):
+    #: Set while an update is queued and has not yet been performed
+    _update_pending = Bool()
+
+    #: State key and resulting shape of the last build
+    _last_build = Value()
+
+    def init_layout(self):
+        super().init_layout()
+        self._last_build = (self.get_state_key(), self.shape)
+
+    def queue_update(self, change=None):
+        """ Schedule an update of the shape once the event loop is idle.
+        Any changes made before then are included in the same update since
+        the shape is always rebuilt from the current state. If there is no
+        application the update is done immediately.
+
+        """
+        if self._update_pending:
+            return
+        if Application.instance() is None:
+            return self.refresh_shape()
+        self._update_pending = True
+        timed_call(0, self._dequeue_update)
+
+    def _dequeue_update(self):
+        if not self._update_pending:
+            return  # Already done by flush_updates
+        self._update_pending = False
+        if self.declaration is None:
+            return  # Destroyed before the update ran
+        self.refresh_shape()
+
+    def flush_updates(self):
+        super().flush_updates()
+        if self._update_pending:
+            self._dequeue_update()
+
+    def get_state_key(self):
+        """ Return a key of everything the shape is built from. Subclasses
+        should override this to allow skipping rebuilds when nothing changed.
+
+        Returns
+        -------
+        key: Tuple or None
+            The state key or None if it cannot be determined.
+
+        """
+        return None
+
+    def refresh_shape(self):
+        """ Update the shape unless the state it was built from is the same.
+        This is common when a value is changed and then reverted before the
+        queued update runs.
+
+        """
+        key = self.get_state_key()
+        last = self._last_build
+        if key is not None and last is not None:
+            last_key, last_shape = last
+            # If the shape was rebuilt elsewhere the key may be stale
+            if key == last_key and last_shape is self.shape:
+                return
         self.update_shape()
+        self._last_build = (key, self.shape)
+
+    def set_direction(self, direction):
+        self.queue_update()
 
     def set_axis(self, axis):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccBooleanOperation(OccOperation, ProxyBooleanOperation):
@@ -94,20 +203,73 @@ class OccBooleanOperation(OccOperation, ProxyBooleanOperation):
     """
     op = Subclass(BRepAlgoAPI_BooleanOperation)
 
-    def update_shape(self, change=None):
+    def apply_options(self, op):
+        """ Apply the parallel, glue, and fuzzy options to the algorithm.
+
+        """
+        d = self.declaration
+        op.SetRunParallel(True)
+        op.SetGlue(GLUE_MODES[d.glue])
+        if d.fuzzy_value:
+            op.SetFuzzyValue(d.fuzzy_value)
+
+    def do_operation(self, shape, tools):
+        """ Apply the operation to the shape with the given tools using
+        OpenCASCADE's parallel mode.
+
+        Parameters
+        ----------
+        shape: TopoDS_Shape
+            The argument of the operation
+        tools: List[TopoDS_Shape]
+            The tools of the operation
+
+        Returns
+        -------
+        result: TopoDS_Shape
+            The result of the operation
+
+        """
         op = self.op()
+        args = TopTools_ListOfShape()
+        args.Append(shape)
+        tool_list = TopTools_ListOfShape()
+        for tool in tools:
+            tool_list.Append(tool)
+        op.SetArguments(args)
+        op.SetTools(tool_list)
+        self.apply_options(op)
+
+        # The history is never used so don't spend time building it
+        op.SetToFillHistory(False)
+        op.Build()
+        if op.HasErrors():
+            raise ValueError("Could not perform %s" % self.declaration)
+        return op.Shape()
+
+    def get_state_key(self):
+        d = self.declaration
+        return (coerce_shape(d.shape1), coerce_shape(d.shape2),
+                tuple(c.shape for c in self.shape_children),
+                d.unify, d.glue, d.fuzzy_value)
+
+    def update_shape(self, change=None):
         d = self.declaration
         if d.shape1 and d.shape2:
-            shape = self.op(coerce_shape(d.shape1),
-                            coerce_shape(d.shape2)).Shape()
+            shapes = [coerce_shape(d.shape1), coerce_shape(d.shape2)]
         else:
-            shape = None
-
-        for c in self.children():
-            if shape is not None:
-                shape = self.op(shape, c.shape).Shape()
-            else:
-                shape = c.shape
+            shapes = []
+        # Skip children without a shape instead of passing them to OCCT
+        shapes.extend(c.shape for c in self.shape_children
+                      if c.shape is not None)
+        if not shapes:
+            raise ValueError("%s has no shapes to operate on" % d)
+
+        shape = shapes[0]
+        tools = shapes[1:]
+        if tools:
+            # Pass all the tools at once so the intersection is only done once
+            shape = self.do_operation(shape, tools)
 
         if d.unify:
             tool = ShapeUpgrade_UnifySameDomain(shape)
@@ -116,6 +278,12 @@ class OccBooleanOperation(OccOperation, ProxyBooleanOperation):
 
         self.shape = Topology.cast_shape(shape)
 
+    def set_glue(self, glue):
+        self.queue_update()
+
+    def set_fuzzy_value(self, value):
+        self.queue_update()
+
 
 class OccCommon(OccBooleanOperation, ProxyCommon):
     """ Common of all the child shapes together. """
@@ -123,6 +291,31 @@ class OccCommon(OccBooleanOperation, ProxyCommon):
                             'class_b_rep_algo_a_p_i___common.html')
     op = set_default(BRepAlgoAPI_Common)
 
+    def do_operation(self, shape, tools):
+        """ OpenCASCADE treats multiple tools as a group so a boolean would
+        give the common of the shape with the union of the tools. Instead use
+        the cells builder which intersects all the shapes once and then keep
+        only the cells inside of every shape.
+
+        """
+        if len(tools) == 1:
+            return super().do_operation(shape, tools)
+        builder = BOPAlgo_CellsBuilder()
+        args = TopTools_ListOfShape()
+        args.Append(shape)
+        for tool in tools:
+            args.Append(tool)
+        builder.SetArguments(args)
+        self.apply_options(builder)
+        builder.Perform()
+        if builder.HasErrors():
+            raise ValueError("Could not perform %s" % self.declaration)
+        # Boundaries are only removed between cells of the same (non-zero)
+        # material so the cells must be given one
+        builder.AddToResult(args, TopTools_ListOfShape(), 1)
+        builder.RemoveInternalBoundaries()
+        return builder.Shape()
+
 
 class OccCut(OccBooleanOperation, ProxyCut):
     """ Cut all the child shapes from the first shape. """
@@ -153,6 +346,7 @@ class OccIntersection(OccBooleanOperation, ProxyIntersection):
             section.AddArgument(coerce_shape(d.shape2))
         for c in self.children():
             section.AddArgument(c.shape)
+        self.apply_options(section)
         section.Perform()
         if section.HasErrors():
             raise ValueError("Could not intersect shape %s" % d)
@@ -183,6 +377,7 @@ class OccSplit(OccBooleanOperation, ProxySplit):
                 shape = c.shape
                 splitter.AddArgument(shape)
         splitter.SetTools(tools)
+        self.apply_options(splitter)
         splitter.Perform()
         if splitter.HasErrors():
             raise ValueError("Could not split shape %s" % d)
@@ -193,11 +388,10 @@ class OccFillet(OccOperation, ProxyFillet):
     reference = set_default('https://dev.opencascade.org/doc/refman/html/'
                             'class_b_rep_fillet_a_p_i___make_fillet.html')
 
-    shape_types = {
-        'rational': ChFi3d_Rational,
-        'angular': ChFi3d_QuasiAngular,
-        'polynomial': ChFi3d_Polynomial
-    }
+    def get_state_key(self):
+        d = self.declaration
+        return (tuple(c.shape for c in self.shape_children), d.disabled,
+                d.shape_type, d.radius, tuple(d.operations))
 
     def update_shape(self, change=None):
         d = self.declaration
@@ -210,10 +404,12 @@ class OccFillet(OccOperation, ProxyFillet):
             return
 
         fillet = BRepFilletAPI_MakeFillet(child.shape)
+        add = fillet.Add
+        radius = d.radius
         operations = d.operations if d.operations else child.topology.edges
         for item in operations:
             if not isinstance(item, (list, tuple)):
-                fillet.Add(d.radius, item)
+                add(radius, item)
                 continue
 
             # If an array of points is create a changing radius fillet
@@ -227,27 +423,37 @@ class OccFillet(OccOperation, ProxyFillet):
                 continue
             if n == 2 and isinstance(item[1], TopoDS_Face):
                 r, face = item
-                for edge in Topology(shape=face).edges_from_face(face):
+                for edge in child.topology.edges_from_face(face):
                     fillet.Add(r, edge)
                 continue
             # custom radius or r1 and r2 radius fillets
-            fillet.Add(*item)
+            add(*item)
+
+        # Compute all the fillets at once
+        fillet.Build()
+        if not fillet.IsDone():
+            raise ValueError("Could not fillet shape %s" % d)
         self.shape = fillet.Shape()
 
     def set_shape_type(self, shape_type):
-        self.update_shape()
+        self.queue_update()
 
     def set_radius(self, r):
-        self.update_shape()
+        self.queue_update()
 
     def set_operations(self, operations):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccChamfer(OccOperation, ProxyChamfer):
     reference = set_default('https://dev.opencascade.org/doc/refman/html/'
                             'class_b_rep_fillet_a_p_i___make_chamfer.html')
 
+    def get_state_key(self):
+        d = self.declaration
+        return (tuple(c.shape for c in self.shape_children), d.disabled,
+                d.distance, d.distance2, tuple(d.operations))
+
     def update_shape(self, change=None):
         d = self.declaration
 
@@ -263,9 +469,10 @@ class OccChamfer(OccOperation, ProxyChamfer):
 
         operations = d.operations if d.operations else child.topology.faces
 
+        distance = d.distance, d.distance2 or d.distance
         for item in operations:
             edge = None
-            d1, d2 = d.distance, d.distance2 or d.distance
+            d1, d2 = distance
             if isinstance(item, (tuple, list)):
                 face = item[-1]
                 n = len(item)
@@ -286,40 +493,38 @@ class OccChamfer(OccOperation, ProxyChamfer):
                     chamfer.Add(d1, d2, edge, face)
             else:
                 chamfer.Add(d1, d2, edge, face)
+
+        # Compute all the chamfers at once
+        chamfer.Build()
+        if not chamfer.IsDone():
+            raise ValueError("Could not chamfer shape %s" % d)
         self.shape = chamfer.Shape()
 
     def set_distance(self, d):
-        self.update_shape()
+        self.queue_update()
 
     def set_distance2(self, d):
-        self.update_shape()
+        self.queue_update()
 
     def set_operations(self, operations):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccOffset(OccOperation, ProxyOffset):
     reference = set_default('https://dev.opencascade.org/doc/refman/html/'
                             'class_b_rep_offset_a_p_i___make_offset.html')
 
-    offset_modes = {
-        'skin': BRepOffset_Skin,
-        'pipe': BRepOffset_Pipe,
-        'recto_verso': BRepOffset_RectoVerso
-    }
-
-    join_types = {
-        'arc': GeomAbs_Arc,
-        'tangent': GeomAbs_Tangent,
-        'intersection': GeomAbs_Intersection,
-    }
-
     def get_shape_to_offset(self):
         d = self.declaration
         if d.shape:
             return coerce_shape(d.shape)
         return self.get_first_child().shape
 
+    def get_state_key(self):
+        d = self.declaration
+        return (self.get_shape_to_offset(), d.closed, d.offset, d.tolerance,
+                d.offset_mode, d.intersection, d.join_type)
+
     def update_shape(self, change=None):
         d = self.declaration
         shape = Topology.cast_shape(self.get_shape_to_offset())
@@ -331,7 +536,7 @@ class OccOffset(OccOperation, ProxyOffset):
                 "Unsupported child shape %s when using planar mode" % t)
 
         offset_shape = BRepOffsetAPI_MakeOffset(
-            shape, self.join_types[d.join_type], not d.closed)
+            shape, JOIN_TYPES[d.join_type], not d.closed)
         offset_shape.Perform(d.offset)
         if not offset_shape.IsDone():
             # Note: Lines cannot be offset as they have no plane of reference
@@ -339,19 +544,19 @@ class OccOffset(OccOperation, ProxyOffset):
         self.shape = offset_shape.Shape()
 
     def set_shape(self, shape):
-        self.update_shape()
+        self.queue_update()
 
     def set_offset(self, offset):
-        self.update_shape()
+        self.queue_update()
 
     def set_offset_mode(self, mode):
-        self.update_shape()
+        self.queue_update()
 
     def set_join_type(self, mode):
-        self.update_shape()
+        self.queue_update()
 
     def set_intersection(self, enabled):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccOffsetShape(OccOffset, ProxyOffsetShape):
@@ -366,10 +571,10 @@ class OccOffsetShape(OccOffset, ProxyOffsetShape):
             shape,
             d.offset,
             d.tolerance,
-            self.offset_modes[d.offset_mode],
+            OFFSET_MODES[d.offset_mode],
             d.intersection,
             False,
-            self.join_types[d.join_type]
+            JOIN_TYPES[d.join_type]
         )
         self.shape = offset_shape.Shape()
 
@@ -391,6 +596,9 @@ class OccThickSolid(OccOffset, ProxyThickSolid):
         for face in topology.faces:
             return [face]
 
+    def get_state_key(self):
+        return super().get_state_key() + (tuple(self.declaration.faces),)
+
     def update_shape(self, change=None):
         d = self.declaration
         shape = self.get_shape_to_offset()
@@ -399,8 +607,8 @@ class OccThickSolid(OccOffset, ProxyThickSolid):
             faces.Append(f)
         assert not faces.IsEmpty()
 
-        offset_mode = self.offset_modes[d.offset_mode]
-        join_type = self.join_types[d.join_type]
+        offset_mode = OFFSET_MODES[d.offset_mode]
+        join_type = JOIN_TYPES[d.join_type]
 
         thick_solid = BRepOffsetAPI_MakeThickSolid()
         thick_solid.MakeThickSolidByJoin(
@@ -416,7 +624,7 @@ class OccThickSolid(OccOffset, ProxyThickSolid):
         self.shape = thick_solid.Shape()
 
     def set_faces(self, faces):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccPipe(OccOperation, ProxyPipe):
@@ -427,18 +635,10 @@ class OccPipe(OccOperation, ProxyPipe):
     _old_spline = Instance(OccShape)
     _old_profile = Instance(OccShape)
 
-    fill_modes = Dict(default={
-        'corrected_frenet': GeomFill_IsCorrectedFrenet,
-        'fixed': GeomFill_IsFixed,
-        'frenet': GeomFill_IsFrenet,
-        'constant_normal': GeomFill_IsConstantNormal,
-        'darboux': GeomFill_IsDarboux,
-        'guide_ac': GeomFill_IsGuideAC,
-        'guide_plan': GeomFill_IsGuidePlan,
-        'guide_ac_contact': GeomFill_IsGuideACWithContact,
-        'guide_plan_contact': GeomFill_IsGuidePlanWithContact,
-        'discrete_trihedron': GeomFill_IsDiscreteTrihedron
-    })
+    def get_state_key(self):
+        d = self.declaration
+        return (coerce_shape(d.spline), coerce_shape(d.profile),
+                tuple(c.shape for c in self.shape_children), d.fill_mode)
 
     def update_shape(self, change=None):
         d = self.declaration
@@ -452,7 +652,7 @@ class OccPipe(OccOperation, ProxyPipe):
             profile = d.profile
             spline = self.get_first_child().shape
         else:
-            shapes = [c.shape for c in self.children() if isinstance(c, OccShape)]
+            shapes = [c.shape for c in self.shape_children]
             spline, profile = shapes[0:2]
 
         args = [coerce_shape(spline), coerce_shape(profile)]
@@ -462,18 +662,18 @@ class OccPipe(OccOperation, ProxyPipe):
             args[0] = BRepBuilderAPI_MakeWire(args[0]).Wire()
 
         if d.fill_mode:
-            args.append(self.fill_modes[d.fill_mode])
+            args.append(FILL_MODES[d.fill_mode])
         pipe = BRepOffsetAPI_MakePipe(*args)
         self.shape = pipe.Shape()
 
     def set_spline(self, spline):
-        self.update_shape()
+        self.queue_update()
 
     def set_profile(self, profile):
-        self.update_shape()
+        self.queue_update()
 
     def set_fill_mode(self, mode):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccThruSections(OccOperation, ProxyThruSections):
@@ -500,13 +700,13 @@ class OccThruSections(OccOperation, ProxyThruSections):
         self.shape = loft.Shape()
 
     def set_solid(self, solid):
-        self.update_shape()
+        self.queue_update()
 
     def set_ruled(self, ruled):
-        self.update_shape()
+        self.queue_update()
 
     def set_precision(self, pres3d):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccTransform(OccOperation, ProxyTransform):
@@ -515,16 +715,54 @@ class OccTransform(OccOperation, ProxyTransform):
 
     _old_shape = Instance(OccShape)
 
+    #: Transform from the last call to get_transform and its parameters
+    _transform = Instance(gp_Trsf)
+    _transform_key = Value()
+
+    def get_transform_key(self):
+        """ Return a hashable key of every parameter the transform depends on.
+
+        """
+        d = self.declaration
+        if d.operations:
+            return tuple(
+                (type(op),) + tuple(getattr(op, m) for m in op.members())
+                for op in d.operations)
+        return (d.position[:], d.direction[:], d.rotation)
+
     def get_transform(self):
+        # Reuse the transform if nothing changed (eg only the child moved)
+        key = self.get_transform_key()
+        if key == self._transform_key:
+            return self._transform
+        result = self._transform = self.compute_transform()
+        self._transform_key = key
+        return result
+
+    def compute_transform(self):
         d = self.declaration
         result = gp_Trsf()
         #: TODO: Order matters... how to configure it???
         if d.operations:
+            # Consecutive translations are summed so they only need one
+            # transform and multiply instead of one per operation
+            dx = dy = dz = 0.0
+            translated = False
             for op in d.operations:
-                t = gp_Trsf()
                 if isinstance(op, Translate):
-                    t.SetTranslation(gp_Vec(op.x, op.y, op.z))
-                elif isinstance(op, Rotate):
+                    dx += op.x
+                    dy += op.y
+                    dz += op.z
+                    translated = True
+                    continue
+                if translated:
+                    t = gp_Trsf()
+                    t.SetTranslation(gp_Vec(dx, dy, dz))
+                    result.Multiply(t)
+                    dx = dy = dz = 0.0
+                    translated = False
+                t = gp_Trsf()
+                if isinstance(op, Rotate):
                     t.SetRotation(gp_Ax1(gp_Pnt(*op.point),
                                         gp_Dir(*op.direction)), op.angle)
                 elif isinstance(op, Mirror):
@@ -534,6 +772,10 @@ class OccTransform(OccOperation, ProxyTransform):
                 elif isinstance(op, Scale):
                     t.SetScale(gp_Pnt(*op.point), op.s)
                 result.Multiply(t)
+            if translated:
+                t = gp_Trsf()
+                t.SetTranslation(gp_Vec(dx, dy, dz))
+                result.Multiply(t)
         else:
             axis = gp_Ax3()
             axis.SetDirection(d.direction.proxy)
@@ -547,6 +789,14 @@ class OccTransform(OccOperation, ProxyTransform):
 
         return result
 
+    def get_state_key(self):
+        d = self.declaration
+        if d.shape:
+            shape = coerce_shape(d.shape)
+        else:
+            shape = tuple(c.shape for c in self.shape_children)
+        return (shape, self.get_transform_key())
+
     def update_shape(self, change=None):
         d = self.declaration
 
@@ -564,29 +814,36 @@ class OccTransform(OccOperation, ProxyTransform):
             original = child.shape
 
         t = self.get_transform()
-        transform = BRepBuilderAPI_Transform(original, t, make_copy)
-        shape = transform.Shape()
+        form = t.Form()
+        if form == gp_Identity and not make_copy:
+            shape = original
+        elif form == gp_Translation:
+            # Only the location changes so the geometry can be shared
+            shape = original.Moved(TopLoc_Location(t))
+        else:
+            transform = BRepBuilderAPI_Transform(original, t, make_copy)
+            shape = transform.Shape()
 
         # Convert it back to the original type
         self.shape = Topology.cast_shape(shape)
 
     def set_shape(self, shape):
         if self._old_shape:
-            self._old_shape.unobserve('shape', self.update_shape)
+            self._old_shape.unobserve('shape', self.queue_update)
         self._old_shape = shape.proxy
-        self._old_shape.observe('shape', self.update_shape)
+        self._old_shape.observe('shape', self.queue_update)
 
     def set_translate(self, translation):
-        self.update_shape()
+        self.queue_update()
 
     def set_rotate(self, rotation):
-        self.update_shape()
+        self.queue_update()
 
     def set_scale(self, scale):
-        self.update_shape()
+        self.queue_update()
 
     def set_mirror(self, axis):
-        self.update_shape()
+        self.queue_update()
 
 
 class OccSew(OccOperation, ProxySew):
@@ -10,6 +10,7 @@ Created on Sep 30, 2016
 @author: jrm
 """
 import os
+from functools import lru_cache
 from atom.api import Typed, Int, Tuple, List, set_default
 
 from OCCT import Aspect, TCollection, NCollection, Graphic3d
@@ -81,6 +82,74 @@ MARKERS = {
     'ball': Aspect.Aspect_TOM_BALL,
 }
 
+FONT_ASPECTS = {
+    'regular': Font_FontAspect.Font_FA_Regular,
+    'bold': Font_FontAspect.Font_FA_Bold,
+    'italic': Font_FontAspect.Font_FA_Italic,
+    'bold-italic': Font_FontAspect.Font_FA_BoldItalic,
+}
+
+HORIZONTAL_ALIGNMENTS = {
+    'left': Graphic3d.Graphic3d_HTA_LEFT,
+    'center': Graphic3d.Graphic3d_HTA_CENTER,
+    'right': Graphic3d.Graphic3d_HTA_RIGHT,
+}
+
+VERTICAL_ALIGNMENTS = {
+    'bottom': Graphic3d.Graphic3d_VTA_BOTTOM,
+    'center': Graphic3d.Graphic3d_VTA_CENTER,
+    'top': Graphic3d.Graphic3d_VTA_TOP,
+    'topfirstline': Graphic3d.Graphic3d_VTA_TOPFIRSTLINE,
+}
+
+
+#: Maximum number of curves kept by each of the build caches
+BUILD_CACHE_SIZE = 4096
+
+
+def axis_key(d):
+    """ Get a hashable key of the axis of the given declaration. """
+    return (d.position[:], d.direction[:], d.rotation)
+
+
+def make_axis(position, direction, rotation):
+    """ Create a gp_Ax2 from an `axis_key`. """
+    axis = gp_Ax2(gp_Pnt(*position), gp_Dir(*direction))
+    axis.Rotate(axis.Axis(), rotation)
+    return axis
+
+
+@lru_cache(maxsize=BUILD_CACHE_SIZE)
+def build_circle(axis, radius):
+    """ Build a circle curve. The curve is shared by every circle with the
+    same parameters but each gets its own edge so the shapes stay distinct.
+
+    """
+    return Geom_Circle(make_axis(*axis), radius)
+
+
+@lru_cache(maxsize=BUILD_CACHE_SIZE)
+def build_ellipse(axis, major, minor):
+    """ Build an ellipse curve. The curve is shared by every ellipse with
+    the same parameters but each gets its own edge so the shapes stay
+    distinct.
+
+    """
+    return Geom_Ellipse(make_axis(*axis), major, minor)
+
+
+def build_polygon(points, closed):
+    """ Build a polygon wire from a tuple of (x, y, z) points.
+
+    """
+    shape = BRepBuilderAPI_MakePolygon()
+    for p in points:
+        shape.Add(gp_Pnt(*p))
+    if closed:
+        shape.Close()
+    curve = BRepAdaptor_CompCurve(shape.Wire())
+    return curve, curve.Wire()
+
 
 class OccPlane(OccShape, ProxyPlane):
     #: Update the class reference
@@ -162,6 +231,20 @@ class OccLine(OccEdge, ProxyLine):
         t = self.get_transform()
         return [p.proxy.Transformed(t) for p in points or d.points]
 
+    def get_transformed_point_array(self, points=None):
+        """ Transform the points directly into a TColgp_Array1OfPnt without
+        building an intermediate list.
+
+        """
+        d = self.declaration
+        t = self.get_transform()
+        points = points or d.points
+        pts = TColgp_Array1OfPnt(1, len(points))
+        set_value = pts.SetValue
+        for i, p in enumerate(points, 1):
+            set_value(i, p.proxy.Transformed(t))
+        return pts
+
     def create_shape(self):
         d = self.declaration
         if len(d.points) == 2:
@@ -268,8 +351,12 @@ class OccCircle(OccEdge, ProxyCircle):
 
     def create_shape(self):
         d = self.declaration
-        curve = self.curve = Geom_Circle(coerce_axis(d.axis), d.radius)
-        self.shape = self.make_edge(curve)
+        if d.surface:
+            curve = self.curve = Geom_Circle(coerce_axis(d.axis), d.radius)
+            self.shape = self.make_edge(curve)
+        else:
+            curve = self.curve = build_circle(axis_key(d), d.radius)
+            self.shape = BRepBuilderAPI_MakeEdge(curve).Edge()
 
     def set_radius(self, r):
         self.create_shape()
@@ -286,8 +373,13 @@ class OccEllipse(OccEdge, ProxyEllipse):
         d = self.declaration
         major = max(d.major_radius, d.minor_radius)
         minor = min(d.major_radius, d.minor_radius)
-        curve = self.curve = Geom_Ellipse(coerce_axis(d.axis), major, minor)
-        self.shape = self.make_edge(curve)
+        if d.surface:
+            curve = Geom_Ellipse(coerce_axis(d.axis), major, minor)
+            self.curve = curve
+            self.shape = self.make_edge(curve)
+        else:
+            curve = self.curve = build_ellipse(axis_key(d), major, minor)
+            self.shape = BRepBuilderAPI_MakeEdge(curve).Edge()
 
     def set_major_radius(self, r):
         self.create_shape()
@@ -345,13 +437,8 @@ class OccBSpline(OccLine, ProxyBSpline):
         if not d.points:
             raise ValueError("Must have at least two points")
         # Poles and weights
-        points = self.get_transformed_points()
-        pts = TColgp_Array1OfPnt(1, len(points))
-        set_value = pts.SetValue
-
         # TODO: Support weights
-        for i, p in enumerate(points):
-            set_value(i+1, p)
+        pts = self.get_transformed_point_array()
         curve = self.curve = GeomAPI_PointsToBSpline(pts).Curve()
         self.shape = self.make_edge(curve)
 
@@ -369,14 +456,8 @@ class OccBezier(OccLine, ProxyBezier):
         if n < 2:
             raise ValueError("A bezier must have at least 2 points!")
 
-        points = self.get_transformed_points()
-        pts = TColgp_Array1OfPnt(1, n)
-        set_value = pts.SetValue
-
         # TODO: Support weights
-        for i, p in enumerate(points):
-            set_value(i+1, p)
-
+        pts = self.get_transformed_point_array()
         curve = self.curve = Geom_BezierCurve(pts)
         self.shape = self.make_edge(curve)
 
@@ -401,8 +482,7 @@ class OccText(OccShape, ProxyText):
             FONT_MANAGER.RegisterFont(font_family, True)
             FONT_REGISTRY.add(font_family)
 
-        attr = "Font_FA_{}".format(d.style.title().replace("-", ""))
-        font_style = getattr(Font_FontAspect, attr, Font_FA_Regular)
+        font_style = FONT_ASPECTS.get(d.style, Font_FA_Regular)
 
         # Fonts are cached by OpenCASCADE so we also cache the here or
         # each time the font instance is released by python it get's lost
@@ -420,10 +500,8 @@ class OccText(OccShape, ProxyText):
         d = self.declaration
         font = self.font
         axis = gp_Ax3(coerce_axis(d.axis))
-        attr = 'Graphic3d_HTA_{}'.format(d.horizontal_alignment.upper())
-        halign = getattr(Graphic3d, attr)
-        attr = 'Graphic3d_VTA_{}'.format(d.vertical_alignment .upper())
-        valign = getattr(Graphic3d, attr)
+        halign = HORIZONTAL_ALIGNMENTS[d.horizontal_alignment]
+        valign = VERTICAL_ALIGNMENTS[d.vertical_alignment]
         text = NCollection.NCollection_String(d.text.encode("utf-8"))
         self.shape = self.builder.Perform(self.font, text, axis, halign, valign)
 
@@ -553,14 +631,18 @@ class OccPolyline(OccWire, ProxyPolyline):
 
     def create_shape(self):
         d = self.declaration
-        t = self.get_transform()
-        shape = BRepBuilderAPI_MakePolygon()
-        for p in d.points:
-            shape.Add(p.proxy.Transformed(t))
-        if d.closed:
-            shape.Close()
-        curve = self.curve = BRepAdaptor_CompCurve(shape.Wire())
-        self.shape = curve.Wire()
+        if d.rotation == 0 and d.direction[:] == (0, 0, 1):
+            # Only translated so skip creating a gp_Pnt for every point
+            dx, dy, dz = d.position[:]
+            points = tuple((p.x + dx, p.y + dy, p.z + dz) for p in d.points)
+        else:
+            t = self.get_transform()
+            points = []
+            for p in d.points:
+                p = p.proxy.Transformed(t)
+                points.append((p.X(), p.Y(), p.Z()))
+            points = tuple(points)
+        self.curve, self.shape = build_polygon(points, d.closed)
 
     def init_layout(self):
         # This does not depened on children
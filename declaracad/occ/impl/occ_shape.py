@@ -83,7 +83,10 @@ def coerce_shape(shape):
 
     """
     if isinstance(shape, Shape):
-        return shape.proxy.shape
+        # Apply any queued updates so the shape is not stale
+        proxy = shape.proxy
+        proxy.flush_updates()
+        return proxy.shape
     return shape
 
 
@@ -112,6 +115,12 @@ class OccShape(ProxyShape):
 
     viewer = Property(_get_viewer, cached=True)
 
+    #: Cached list of the child proxies which are shapes
+    def _get_shape_children(self):
+        return [c for c in self.children() if isinstance(c, OccShape)]
+
+    shape_children = Property(_get_shape_children, cached=True)
+
     location = Typed(TopLoc_Location)
 
     # -------------------------------------------------------------------------
@@ -173,9 +182,29 @@ class OccShape(ProxyShape):
 
     def get_first_child(self):
         """ Return shape to apply the operation to. """
-        for child in self.children():
-            if isinstance(child, OccShape):
-                return child
+        children = self.shape_children
+        if children:
+            return children[0]
+
+    def child_added(self, child):
+        super().child_added(child)
+        self.get_member('shape_children').reset(self)
+
+    def child_moved(self, child):
+        super().child_moved(child)
+        self.get_member('shape_children').reset(self)
+
+    def child_removed(self, child):
+        super().child_removed(child)
+        self.get_member('shape_children').reset(self)
+
+    def flush_updates(self):
+        """ Perform any queued updates of the child shapes and then this
+        shape so the shape reflects the current state of the declaration.
+
+        """
+        for child in self.shape_children:
+            child.flush_updates()
 
     def child_shapes(self):
         """ Iterator of all child shapes """
@@ -332,7 +361,7 @@ class OccDependentShape(OccShape):
 
         # When they change re-compute
         for child in self.children():
-            child.observe('shape', self.update_shape)
+            child.observe('shape', self.queue_update)
 
     def update_shape(self, change=None):
         """ Must be implmented in subclasses to create the shape
@@ -340,15 +369,23 @@ class OccDependentShape(OccShape):
         """
         raise NotImplementedError
 
+    def queue_update(self, change=None):
+        """ Called when a child shape changes. By default the shape is
+        updated immediately but subclasses may defer it so several changes
+        only trigger a single update.
+
+        """
+        self.update_shape(change)
+
     def child_added(self, child):
         super().child_added(child)
         if isinstance(child, OccShape):
-            child.observe('shape', self.update_shape)
+            child.observe('shape', self.queue_update)
 
     def child_removed(self, child):
         super().child_removed(child)
         if isinstance(child, OccShape):
-            child.unobserve('shape', self.update_shape)
+            child.unobserve('shape', self.queue_update)
 
     def set_direction(self, direction):
         self.update_shape()
@@ -427,7 +464,7 @@ class OccFace(OccDependentShape, ProxyFace):
         if d.wires:
             shapes = d.wires
         else:
-            shapes = [c for c in self.children() if isinstance(c, OccShape)]
+            shapes = self.shape_children
         if not shapes:
             raise ValueError(
                 "No wires or children available to create a face!")
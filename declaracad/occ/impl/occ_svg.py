@@ -12,6 +12,7 @@ Created on Sep 20, 2018
 import os
 import re
 import warnings
+from functools import lru_cache
 from atom.api import Atom, List, Instance, set_default
 from lxml import etree
 from math import radians, sqrt, tan, atan, atan2, cos, acos, sin, pi
@@ -528,6 +529,43 @@ SVG_NODES = {
 }
 
 
+#: Maximum number of parsed documents kept by the svg cache
+SVG_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=SVG_CACHE_SIZE)
+def load_svg(source, mtime=None):
+    """ Parse the svg source and build a compound of all of its shapes. The
+    result is shared by every Svg with the same source.
+
+    Parameters
+    ----------
+    source: String
+        Path or svg text to parse
+    mtime: Float
+        Modification time of the file, used to reparse it when it changes.
+
+    Returns
+    -------
+    result: Tuple
+        The OccSvgDoc and the TopoDS_Compound of its shapes.
+
+    """
+    path = os.path.expanduser(source)
+    if mtime is not None:
+        svg = etree.parse(path).getroot()
+    else:
+        svg = etree.fromstring(source)
+    node = OccSvgDoc(element=svg)
+
+    builder = BRep_Builder()
+    shape = TopoDS_Compound()
+    builder.MakeCompound(shape)
+    for s in node.create_shape():
+        builder.Add(shape, s)
+    return node, shape
+
+
 class OccSvg(OccShape, ProxySvg):
     #: Update the class reference
     reference = set_default('https://dev.opencascade.org/doc/refman/html/'
@@ -543,11 +581,11 @@ class OccSvg(OccShape, ProxySvg):
         d = self.declaration
         if not d.source:
             return
-        if os.path.exists(os.path.expanduser(d.source)):
-            svg = etree.parse(os.path.expanduser(d.source)).getroot()
-        else:
-            svg = etree.fromstring(d.source)
-        node = self.doc = OccSvgDoc(element=svg)
+        path = os.path.expanduser(d.source)
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        node, shape = load_svg(d.source, mtime)
+        svg = node.element
+        self.doc = node
         viewbox = svg.attrib.get('viewBox')
         x, y = (0, 0)
         sx, sy = (1, 1)
@@ -558,14 +596,6 @@ class OccSvg(OccShape, ProxySvg):
             sx = ow/iw
             sy = oh/ih
 
-        builder = BRep_Builder()
-        shape = TopoDS_Compound()
-        builder.MakeCompound(shape)
-
-        shapes = node.create_shape()
-        for s in shapes:
-            builder.Add(shape, s)
-
         bbox = self.get_bounding_box(shape)
 
         # Move to position and align along direction axis
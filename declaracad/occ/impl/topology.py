@@ -9,7 +9,7 @@ Created on Sep 30, 2016
 
 @author: jrm
 """
-from atom.api import Atom, Instance, Typed, Bool, List
+from atom.api import Atom, Instance, Typed, Bool, List, Dict
 
 from OCCT import GeomAbs
 from OCCT.BOPAlgo import BOPAlgo_Section
@@ -173,6 +173,9 @@ class Topology(Atom):
     #: for further reference see TopoDS_Shape IsEqual / IsSame methods
     ignore_orientation = Bool()
 
+    #: Edges of each face that has been looked up with `edges_from_face`
+    face_edges = Dict()
+
     def _loop_topo(self, topology_type, topological_entity=None,
                    topology_type_to_avoid=None):
         """ this could be a faces generator for a python TopoShape class
@@ -359,7 +362,11 @@ class Topology(Atom):
         :param face:
         :return:
         """
-        return self._loop_topo(TopAbs_EDGE, face)
+        edges = self.face_edges.get(face)
+        if edges is None:
+            edges = self.face_edges[face] = self._loop_topo(TopAbs_EDGE, face)
+        # Return a copy so callers cannot modify the cache
+        return list(edges)
 
     # ----------------------------------------------------------------------
     # VERTEX <-> EDGE
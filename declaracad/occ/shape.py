@@ -12,9 +12,10 @@ Created on Sep 30, 2016
 """
 import math
 from math import pi
+from contextlib import contextmanager
 from atom.api import (
     Atom, Tuple, Instance, Bool, Str, Float, FloatRange, Property, Coerced,
-    Typed, ForwardTyped, List, Enum, Event, Value, Subclass,
+    Typed, ForwardTyped, List, Enum, Event, Value, Subclass, Member,
     observe, set_default
 )
 from enaml.application import Application
@@ -61,6 +62,12 @@ class ProxyShape(ProxyControl):
     def get_bounding_box(self):
         raise NotImplementedError
 
+    def child_moved(self, child):
+        pass
+
+    def flush_updates(self):
+        pass
+
 
 class ProxyPart(ProxyShape):
     #: A reference to the Shape declaration.
@@ -302,6 +309,52 @@ class Material(Atom):
     emissive_color = ColorMember()
 
 
+#: Proxy updates deferred by `batch`. This maps each shape to a dict
+#: (used as an ordered set) of the names of the members which changed.
+_batch_updates = {}
+
+#: Number of nested `batch` blocks currently open
+_batch_depth = 0
+
+
+@contextmanager
+def batch():
+    """ Defer proxy updates of all shapes until the block exits so that
+    changing several related members only applies each change once.
+
+    Examples
+    --------
+
+    with batch():
+        ellipse.major_radius = 5
+        ellipse.minor_radius = 3
+
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    except BaseException:
+        # Drop the pending updates so they cannot hide the original error
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            _batch_updates.clear()
+        raise
+    _batch_depth -= 1
+    if _batch_depth == 0:
+        pending = list(_batch_updates.items())
+        _batch_updates.clear()
+        for shape, names in pending:
+            for name in names:
+                change = {
+                    'type': 'update',
+                    'object': shape,
+                    'name': name,
+                    'value': getattr(shape, name)
+                }
+                ToolkitObject._update_proxy(shape, change)
+
+
 class Shape(ToolkitObject):
     """ Abstract shape component that can be displayed on the screen
     and represented by the framework.
@@ -402,7 +455,7 @@ class Shape(ToolkitObject):
     axis = d_(Property(_get_axis, _set_axis))
 
     def _get_topology(self):
-        return self.proxy.topology
+        return self.get_proxy().topology
 
     #: A read only property that accesses the topology of the shape such
     #: as edges, faces, shells, solids, etc....
@@ -421,8 +474,28 @@ class Shape(ToolkitObject):
     @observe('color', 'transparency', 'display',
              'texture', 'position', 'direction')
     def _update_proxy(self, change):
+        if _batch_depth and change['type'] == 'update':
+            _batch_updates.setdefault(self, {})[change['name']] = None
+            return
         super()._update_proxy(change)
 
+    def __init_subclass__(cls, **kwargs):
+        """ Observe all members tagged with `proxy=True` using the
+        `_update_proxy` handler so subclasses only need to tag members
+        which should be forwarded to the proxy.
+
+        Notes
+        -----
+        Only tagged members are observed, so a member which is redefined in
+        a subclass must also be tagged for changes to reach the proxy.
+
+        """
+        super().__init_subclass__(**kwargs)
+        for member in cls.__dict__.values():
+            if isinstance(member, Member) and member.metadata and \
+                    member.metadata.get('proxy'):
+                member.add_static_observer('_update_proxy')
+
     @observe('proxy.shape')
     def _update_properties(self, change):
         """ Clear the cached references when the shape changes. """
@@ -433,6 +506,15 @@ class Shape(ToolkitObject):
     #: Triggered when the shape is constructed
     constructed = d_(Event(), writable=False)
 
+    def child_moved(self, child):
+        """ Notify the proxy when a child is reordered since the order of
+        children matters for operations.
+
+        """
+        super().child_moved(child)
+        if self.proxy_is_active and isinstance(child, Shape):
+            self.proxy.child_moved(child.proxy)
+
     def activate_proxy(self):
         """ Activate the proxy object tree.
 
@@ -474,8 +556,25 @@ class Shape(ToolkitObject):
             self.initialize()
         if not self.proxy_is_active:
             self.activate_proxy()
+        else:
+            # Apply any changes that are still waiting on the event loop
+            self.proxy.flush_updates()
         return self.proxy.shape
 
+    def get_proxy(self):
+        """ Retrieve the proxy, creating and activating it on first access.
+        The proxy is not created until the declaration is initialized so
+        this should be used by any api that needs the underlying shape.
+
+        Returns
+        -------
+        proxy: ProxyShape
+            The activated proxy of this declaration.
+
+        """
+        self.render()
+        return self.proxy
+
 
 class Part(Shape):
     """ A Part is a compound shape. It may contain
@@ -562,20 +661,16 @@ class Box(Shape):
     proxy = Typed(ProxyBox)
 
     #: x size
-    dx = d_(Float(1, strict=False)).tag(view=True)
+    dx = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: y size
-    dy = d_(Float(1, strict=False)).tag(view=True)
+    dy = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: z size
-    dz = d_(Float(1, strict=False)).tag(view=True)
+    dz = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     # TODO: Handle other constructors
 
-    @observe('dx', 'dy', 'dz')
-    def _update_proxy(self, change):
-        super(Box, self)._update_proxy(change)
-
 
 class Cone(Shape):
     """ A primitive Cone shape.
@@ -605,20 +700,16 @@ class Cone(Shape):
     proxy = Typed(ProxyCone)
 
     #: Radius
-    radius = d_(Float(1, strict=False)).tag(view=True)
+    radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Radius 2 size
-    radius2 = d_(Float(0, strict=False)).tag(view=True)
+    radius2 = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
     #: Height
-    height = d_(Float(1, strict=False)).tag(view=True)
+    height = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Angle
-    angle = d_(Float(0, strict=False)).tag(view=True)
-
-    @observe('radius', 'radius2', 'height', 'angle')
-    def _update_proxy(self, change):
-        super(Cone, self)._update_proxy(change)
+    angle = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
 
 class Cylinder(Shape):
@@ -646,17 +737,13 @@ class Cylinder(Shape):
     proxy = Typed(ProxyCylinder)
 
     #: Radius
-    radius = d_(Float(1, strict=False)).tag(view=True)
+    radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Height
-    height = d_(Float(1, strict=False)).tag(view=True)
+    height = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Angle
-    angle = d_(Float(0, strict=False)).tag(view=True)
-
-    @observe('radius', 'height', 'angle')
-    def _update_proxy(self, change):
-        super(Cylinder, self)._update_proxy(change)
+    angle = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
 
 class HalfSpace(Shape):
@@ -694,14 +781,10 @@ class HalfSpace(Shape):
     proxy = Typed(ProxyHalfSpace)
 
     #: Surface that is either a face or a Shell
-    surface = d_(Instance((TopoDS_Face, TopoDS_Shell)))
+    surface = d_(Instance((TopoDS_Face, TopoDS_Shell))).tag(proxy=True)
 
     #: Side of surface where the space is located
-    side = d_(Coerced(Point, coercer=coerce_point))
-
-    @observe('surface', 'side')
-    def _update_proxy(self, change):
-        super(HalfSpace, self)._update_proxy(change)
+    side = d_(Coerced(Point, coercer=coerce_point)).tag(proxy=True)
 
 
 class Prism(Shape):
@@ -740,20 +823,17 @@ class Prism(Shape):
     proxy = Typed(ProxyPrism)
 
     #: Shape to build prism from
-    shape = d_(Instance(Shape)).tag(view=True)
+    shape = d_(Instance(Shape)).tag(view=True, proxy=True)
 
     #: Vector to build prism from, ignored if infinite is true
-    vector = d_(Tuple((float, int), default=(0, 0, 1))).tag(view=True)
+    vector = d_(Tuple((float, int), default=(0, 0, 1))).tag(
+        view=True, proxy=True)
 
     #: Infinite
-    infinite = d_(Bool(False)).tag(view=True)
+    infinite = d_(Bool(False)).tag(view=True, proxy=True)
 
     #: Attempt to canonize
-    canonize = d_(Bool(True)).tag(view=True)
-
-    @observe('shape', 'vector', 'infinite', 'canonize')
-    def _update_proxy(self, change):
-        super(Prism, self)._update_proxy(change)
+    canonize = d_(Bool(True)).tag(view=True, proxy=True)
 
 
 class Sphere(Shape):
@@ -801,20 +881,19 @@ class Sphere(Shape):
     proxy = Typed(ProxySphere)
 
     #: Radius of sphere
-    radius = d_(Float(1, strict=False)).tag(view=True)
+    radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Angle of U (fraction of circle)
-    angle = d_(FloatRange(low=0.0, high=2*pi, value=2*pi)).tag(view=True)
+    angle = d_(FloatRange(low=0.0, high=2*pi, value=2*pi)).tag(
+        view=True, proxy=True)
 
     #: Min Angle of V (fraction of circle in normal direction)
-    angle2 = d_(FloatRange(low=-pi/2, high=pi/2, value=-pi/2)).tag(view=True)
+    angle2 = d_(FloatRange(low=-pi/2, high=pi/2, value=-pi/2)).tag(
+        view=True, proxy=True)
 
     #: Max Angle of V (fraction of circle in normal direction)
-    angle3 = d_(FloatRange(low=-pi/2, high=pi/2, value=pi/2)).tag(view=True)
-
-    @observe('radius', 'angle', 'angle2', 'angle3')
-    def _update_proxy(self, change):
-        super(Sphere, self)._update_proxy(change)
+    angle3 = d_(FloatRange(low=-pi/2, high=pi/2, value=pi/2)).tag(
+        view=True, proxy=True)
 
 
 class Torus(Shape):
@@ -843,23 +922,20 @@ class Torus(Shape):
     proxy = Typed(ProxyTorus)
 
     #: Radius of sphere
-    radius = d_(Float(1, strict=False)).tag(view=True)
+    radius = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: Radius 2
-    radius2 = d_(Float(0, strict=False)).tag(view=True)
+    radius2 = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
     #: Angle of U (fraction of circle)
-    angle = d_(FloatRange(low=0.0, high=2*pi, value=2*pi)).tag(view=True)
+    angle = d_(FloatRange(low=0.0, high=2*pi, value=2*pi)).tag(
+        view=True, proxy=True)
 
     #: Start Angle of V (fraction of circle in normal direction)
-    angle2 = d_(Float(0, strict=False)).tag(view=True)
+    angle2 = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
     #: Stop Angle of V (fraction of circle in normal direction)
-    angle3 = d_(Float(0, strict=False)).tag(view=True)
-
-    @observe('radius', 'radius2', 'angle', 'angle2', 'angle3')
-    def _update_proxy(self, change):
-        super(Torus, self)._update_proxy(change)
+    angle3 = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
 
 class Wedge(Shape):
@@ -889,23 +965,19 @@ class Wedge(Shape):
     proxy = Typed(ProxyWedge)
 
     #: x size
-    dx = d_(Float(1, strict=False)).tag(view=True)
+    dx = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: y size
-    dy = d_(Float(1, strict=False)).tag(view=True)
+    dy = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: z size
-    dz = d_(Float(1, strict=False)).tag(view=True)
+    dz = d_(Float(1, strict=False)).tag(view=True, proxy=True)
 
     #: z size
-    itx = d_(Float(0, strict=False)).tag(view=True)
+    itx = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
     # TODO: Handle other constructors
 
-    @observe('dx', 'dy', 'dz', 'itx')
-    def _update_proxy(self, change):
-        super(Wedge, self)._update_proxy(change)
-
 
 class Revol(Shape):
     """ A Revol creates a shape by revolving a profile about an axis.
@@ -933,14 +1005,10 @@ class Revol(Shape):
     proxy = Typed(ProxyRevol)
 
     #: Shape to build prism from
-    shape = d_(Instance(Shape)).tag(view=True)
+    shape = d_(Instance(Shape)).tag(view=True, proxy=True)
 
     #: Angle to revolve
-    angle = d_(Float(0, strict=False)).tag(view=True)
-
-    @observe('shape', 'angle')
-    def _update_proxy(self, change):
-        super(Revol, self)._update_proxy(change)
+    angle = d_(Float(0, strict=False)).tag(view=True, proxy=True)
 
 
 class RawShape(Shape):
@@ -10,9 +10,11 @@ Created on Jul 12, 2015
 @author: jrm
 """
 import enaml
-from atom.api import Atom, List, Str, Instance, Dict, Enum
+from collections import defaultdict
+from atom.api import Atom, Bool, List, Str, Instance, Dict, Enum
 from declaracad.core.api import Plugin, DockItem, log
 
+from enaml.application import Application, timed_call
 from enaml.layout.api import (
     AreaLayout, DockBarLayout, HSplitLayout, VSplitLayout, TabLayout
 )
@@ -25,6 +27,9 @@ with enaml.imports():
 
 ALL_STYLES = ['system'] + available_styles()
 
+#: Layouts of DockItems which are put in a dock bar
+DOCK_BAR_SIDES = ('top', 'left', 'right', 'bottom')
+
 
 class DeclaracadPlugin(Plugin):
     #: Project site
@@ -35,6 +40,9 @@ class DeclaracadPlugin(Plugin):
     dock_layout = Instance(AreaLayout)
     dock_style = Enum(*reversed(ALL_STYLES)).tag(config=True)
 
+    #: Set while a refresh of the dock items is queued
+    _dock_refresh_pending = Bool()
+
     #: Settings pages to add
     settings_pages = List(extensions.SettingsPage)
 
@@ -57,7 +65,7 @@ class DeclaracadPlugin(Plugin):
         super(DeclaracadPlugin, self)._bind_observers()
         workbench = self.workbench
         point = workbench.get_extension_point(extensions.DOCK_ITEM_POINT)
-        point.observe('extensions', self._refresh_dock_items)
+        point.observe('extensions', self._queue_refresh_dock_items)
 
         point = workbench.get_extension_point(extensions.SETTINGS_PAGE_POINT)
         point.observe('extensions', self._refresh_settings_pages)
@@ -68,7 +76,7 @@ class DeclaracadPlugin(Plugin):
         super(DeclaracadPlugin, self)._unbind_observers()
         workbench = self.workbench
         point = workbench.get_extension_point(extensions.DOCK_ITEM_POINT)
-        point.unobserve('extensions', self._refresh_dock_items)
+        point.unobserve('extensions', self._queue_refresh_dock_items)
 
         point = workbench.get_extension_point(extensions.SETTINGS_PAGE_POINT)
         point.unobserve('extensions', self._refresh_settings_pages)
@@ -99,6 +107,23 @@ class DeclaracadPlugin(Plugin):
             ui.select_workspace('declaracad.workspace')
         return ui.workspace.content.find('dock_area')
 
+    def _queue_refresh_dock_items(self, change=None):
+        """ Schedule a refresh of the dock items once the event loop is idle
+        so a burst of extension changes (eg when plugins are loaded at
+        startup) only creates the items and layout once.
+
+        """
+        if self._dock_refresh_pending:
+            return
+        if Application.instance() is None:
+            return self._refresh_dock_items()
+        self._dock_refresh_pending = True
+        timed_call(0, self._dequeue_refresh_dock_items)
+
+    def _dequeue_refresh_dock_items(self):
+        self._dock_refresh_pending = False
+        self._refresh_dock_items()
+
     def _refresh_dock_items(self, change=None):
         """ Reload all DockItems registered by any Plugins
 
@@ -110,7 +135,7 @@ class DeclaracadPlugin(Plugin):
         point = workbench.get_extension_point(extensions.DOCK_ITEM_POINT)
 
         #: Layout spec
-        layout = {name: [] for name in extensions.DockItem.layout.items}
+        layout = defaultdict(list)
 
         dock_items = []
         for extension in sorted(point.extensions, key=lambda ext: ext.rank):
@@ -138,13 +163,13 @@ class DeclaracadPlugin(Plugin):
         """
         if not self.dock_items:
             return AreaLayout()
-        items = layout.pop('main')
+        items = layout.get('main')
         if not items:
             raise EnvironmentError("At least one main layout item must be "
                                    "defined!")
 
-        left_items = layout.pop('main-left', [])
-        bottom_items = layout.pop('main-bottom', [])
+        left_items = layout.get('main-left')
+        bottom_items = layout.get('main-bottom')
 
         main = TabLayout(*items)
 
@@ -153,8 +178,8 @@ class DeclaracadPlugin(Plugin):
         if left_items:
             main = HSplitLayout(*left_items, main)
 
-        dockbars = [DockBarLayout(*items, position=side)
-                    for side, items in layout.items() if items]
+        dockbars = [DockBarLayout(*layout[side], position=side)
+                    for side in DOCK_BAR_SIDES if layout.get(side)]
 
         #: Update layout
         self.dock_layout = AreaLayout(main, dock_bars=dockbars)
@@ -26,11 +26,11 @@ def find_enaml_files(*modules):
         mod_path = dirname(mod.__file__)
         pkg_root = dirname(mod_path)
 
-        for file_type in ['enaml', 'png']:
-            for f in glob('{}/**/*.{}'.format(mod_path, file_type),
-                          recursive=True):
-                pkg = f.replace(pkg_root+os.path.sep, '')
-                files[f] = pkg
+        for root, dirs, filenames in os.walk(mod_path):
+            for f in filenames:
+                if f.endswith(('.enaml', '.png')):
+                    path = os.path.join(root, f)
+                    files[path] = os.path.relpath(path, pkg_root)
 
     return files.items()
 
@@ -42,9 +42,11 @@ def find_data_files(*modules):
         mod_path = name
         pkg_root = name
 
-        for f in glob('{}/**/*.png'.format(mod_path), recursive=True):
-            pkg = f.replace(pkg_root+os.path.sep, '')
-            files[f] = pkg
+        for root, dirs, filenames in os.walk(mod_path):
+            for f in filenames:
+                if f.endswith('.png'):
+                    path = os.path.join(root, f)
+                    files[path] = os.path.relpath(path, pkg_root)
     return files.items()
 
 
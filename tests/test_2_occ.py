@@ -1,6 +1,8 @@
 import pytest
 from textwrap import dedent
 
+from OCCT.BRepGProp import BRepGProp
+from OCCT.GProp import GProp_GProps
 from OCCT.TopoDS import TopoDS_Shape
 
 from declaracad.occ.plugin import load_model
@@ -163,13 +165,80 @@ TESTS = {
         Box:
             position = (0.5, 0.5, 0)
     """,
+'cut3': """
+    Cut:
+        Box:
+            pass
+        Box:
+            position = (0.5, 0.5, 0)
+        Box:
+            position = (-0.5, -0.5, 0)
+    """,
+'fuse3': """
+    Fuse:
+        Box:
+            pass
+        Box:
+            position = (0.5, 0.5, 0)
+        Box:
+            position = (-0.5, -0.5, 0)
+    """,
+'fuse-glue': """
+    Fuse:
+        glue = 'shift'
+        Box:
+            pass
+        Box:
+            position = (1, 0, 0)
+    """,
+'fuse-fuzzy': """
+    Fuse:
+        fuzzy_value = 1e-5
+        Box:
+            pass
+        Box:
+            position = (1 + 1e-6, 0, 0)
+    """,
+'split-glue': """
+    Split:
+        glue = 'shift'
+        Box:
+            pass
+        Box:
+            position = (1, 0, 0)
+    """,
+'split-fuzzy': """
+    Split:
+        fuzzy_value = 1e-5
+        Box:
+            pass
+        Box:
+            position = (0.5, 0.5, 0)
+    """,
+'intersection-fuzzy': """
+    Intersection:
+        fuzzy_value = 1e-5
+        Box:
+            pass
+        Box:
+            position = (0.5, 0.5, 0)
+    """,
 'common': """
     Common:
         Box:
             pass
         Box:
             position = (0.5, 0.5, 0)
-    """
+    """,
+'common3': """
+    Common:
+        Box:
+            pass
+        Box:
+            position = (0.5, 0.5, 0)
+        Box:
+            position = (-0.25, -0.25, 0)
+    """,
 }
 
 
@@ -179,8 +248,103 @@ def test_shapes_render(qt_app, name):
     assert isinstance(assembly.render(), TopoDS_Shape)
 
 
+def volume(shape):
+    props = GProp_GProps()
+    BRepGProp.VolumeProperties_(shape, props)
+    return props.Mass()
+
+
+@pytest.mark.parametrize('name, expected', (
+    ('cut3', 1 - 2 * 0.5 * 0.5),
+    ('fuse3', 3 - 2 * 0.5 * 0.5),
+    ('fuse-glue', 2),
+    ('fuse-fuzzy', 2),
+))
+def test_boolean_volume(qt_app, name, expected):
+    assembly = load_model("test", TEMPLATE % TESTS[name])[0]
+    assert volume(assembly.render()) == pytest.approx(expected)
+
+
+def test_common3_volume(qt_app):
+    assembly = load_model("test", TEMPLATE % TESTS['common3'])[0]
+    # Only the region inside all three boxes, not the first box in common
+    # with the union of the others
+    assert volume(assembly.render()) == pytest.approx(0.25 * 0.25)
+
+
+def test_batch_updates(qt_app):
+    from declaracad.occ.api import Ellipse, batch
+    ellipse = Ellipse()
+    assert isinstance(ellipse.render(), TopoDS_Shape)
+    changes = []
+    ellipse.proxy.observe('shape', changes.append)
+    with batch():
+        ellipse.major_radius = 5
+        ellipse.minor_radius = 3
+        ellipse.major_radius = 6
+        assert not changes
+    # Only one rebuild per changed member
+    assert len(changes) == 2
+
+
+def test_batch_error(qt_app):
+    from declaracad.occ.api import Ellipse, batch
+    ellipse = Ellipse()
+    ellipse.render()
+    changes = []
+    ellipse.proxy.observe('shape', changes.append)
+    with pytest.raises(ZeroDivisionError):
+        with batch():
+            ellipse.major_radius = 5
+            1 / 0
+    # Pending updates are dropped so the original error is raised
+    assert not changes
+    with batch():
+        ellipse.minor_radius = 1.5
+    assert len(changes) == 1
+
+
+def test_build_cache(qt_app):
+    from declaracad.occ.api import Circle
+    c1, c2, c3 = Circle(radius=5), Circle(radius=5), Circle(radius=6)
+    # The curve is shared but each circle must have its own edge
+    assert not c1.render().IsSame(c2.render())
+    assert c1.proxy.curve is c2.proxy.curve
+    assert c1.proxy.curve is not c3.proxy.curve
+
 
+def test_skip_unchanged_rebuild(qt_app):
+    from declaracad.occ.api import Box, Fillet
+    fillet = Fillet(radius=0.1)
+    Box(parent=fillet)
+    shape = fillet.render()
+    fillet.radius = 0.2
+    fillet.radius = 0.1
+    assert fillet.render() is shape
+    fillet.radius = 0.2
+    assert fillet.render() is not shape
 
 
+def test_queued_updates(qt_app):
+    from declaracad.occ.api import Box, Fillet
+    fillet = Fillet(radius=0.1)
+    Box(parent=fillet)
+    fillet.render()
+    changes = []
+    fillet.proxy.observe('shape', changes.append)
+    fillet.radius = 0.2
+    fillet.radius = 0.3
+    # Updates wait for the event loop unless the shape is rendered
+    assert not changes
+    assert fillet.render() is fillet.proxy.shape
+    assert len(changes) == 1
 
 
+def test_coerce_shape_flushes_updates(qt_app):
+    from declaracad.occ.api import Box, Fillet
+    from declaracad.occ.impl.occ_shape import coerce_shape
+    fillet = Fillet(radius=0.1)
+    Box(parent=fillet)
+    shape = fillet.render()
+    fillet.radius = 0.2
+    assert coerce_shape(fillet) is not shape